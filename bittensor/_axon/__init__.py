@@ -21,7 +21,9 @@ import argparse
 import os
 import copy
 import inspect
+import threading
 import time
+from collections import OrderedDict, deque
 from concurrent import futures
 from typing import List, Callable
 from bittensor._threadpool import prioritythreadpool
@@ -33,6 +35,14 @@ from substrateinterface import Keypair
 import bittensor
 from . import axon_impl
 
+_SS58_LEN = bittensor.__ss58_address_length__
+
+def _env( name: str, default, cast: Callable = str ):
+    r""" Returns the enviroment variable converted with cast, or the default when it is unset.
+    """
+    value = os.environ.get( name )
+    return cast( value ) if value is not None else default
+
 class axon:
     """ The factor class for bittensor.Axon object
     The Axon acts a grpc server for the bittensor network and allows for communication between neurons.
@@ -62,11 +72,15 @@ class axon:
             ip: str = None,
             max_workers: int = None, 
             maximum_concurrent_rpcs: int = None,
+            max_inflight: int = None,
+            max_message_length: int = None,
             blacklist: 'Callable' = None,
             priority: 'Callable' = None,
             forward_timeout: int = None,
             backward_timeout: int = None,
             compression: str = None,
+            compression_threshold: int = None,
+            verify_timeout: float = None,
         ) -> 'bittensor.Axon':
         r""" Creates a new bittensor.Axon object from passed arguments.
             Args:
@@ -100,6 +114,10 @@ class axon:
                     Used to create the threadpool if not passed, specifies the number of active threads servicing requests.
                 maximum_concurrent_rpcs (:type:`int`, `optional`):
                     Maximum allowed concurrently processed RPCs.
+                max_inflight (:type:`int`, `optional`):
+                    Maximum admitted RPCs before new requests are rejected with UNAVAILABLE, only used below maximum_concurrent_rpcs.
+                max_message_length (:type:`int`, `optional`):
+                    Maximum size in bytes of a sent or received grpc message.
                 blacklist (:obj:`callable`, `optional`):
                     function to blacklist requests.
                 priority (:obj:`callable`, `optional`):
@@ -108,18 +126,30 @@ class axon:
                     timeout on the forward requests. 
                 backward_timeout (:type:`int`, `optional`):
                     timeout on the backward requests.              
+                compression (:type:`str`, `optional`):
+                    compression algorithm applied to outbound responses (gzip, deflate, NoCompression).
+                compression_threshold (:type:`int`, `optional`):
+                    responses smaller than this many bytes are sent uncompressed.
+                verify_timeout (:type:`float`, `optional`):
+                    seconds a request waits for signature verification before it is rejected with UNAVAILABLE.
         """   
 
         if config == None: 
             config = axon.config()
-        config = copy.deepcopy(config)
+        # Only the axon subtree is written below, the rest of the config is shared with the caller.
+        config = copy.copy(config)
+        config.axon = copy.copy(config.axon)
         config.axon.port = port if port != None else config.axon.port
         config.axon.ip = ip if ip != None else config.axon.ip
         config.axon.max_workers = max_workers if max_workers != None else config.axon.max_workers
         config.axon.maximum_concurrent_rpcs = maximum_concurrent_rpcs if maximum_concurrent_rpcs != None else config.axon.maximum_concurrent_rpcs
+        config.axon.max_inflight = max_inflight if max_inflight != None else config.axon.max_inflight
+        config.axon.max_message_length = max_message_length if max_message_length != None else config.axon.max_message_length
         config.axon.forward_timeout = forward_timeout if forward_timeout != None else config.axon.forward_timeout
         config.axon.backward_timeout = backward_timeout if backward_timeout != None else config.axon.backward_timeout
         config.axon.compression = compression if compression != None else config.axon.compression
+        config.axon.compression_threshold = compression_threshold if compression_threshold != None else config.axon.compression_threshold
+        config.axon.verify_timeout = verify_timeout if verify_timeout != None else config.axon.verify_timeout
         axon.check_config( config )
 
         # Determine the grpc compression algorithm
@@ -135,11 +165,22 @@ class axon:
         if thread_pool == None:
             thread_pool = futures.ThreadPoolExecutor( max_workers = config.axon.max_workers )
         if server == None:
+            interceptors = (AuthInterceptor(blacklist=blacklist, verify_timeout=config.axon.verify_timeout),)
+            # grpc already rejects calls past maximum_concurrent_rpcs, shedding only helps below that.
+            if config.axon.max_inflight < config.axon.maximum_concurrent_rpcs:
+                interceptors = (LoadSheddingInterceptor(limit=config.axon.max_inflight),) + interceptors
             server = grpc.server( thread_pool,
-                                  interceptors=(AuthInterceptor(blacklist=blacklist),),
+                                  interceptors=interceptors,
                                   maximum_concurrent_rpcs = config.axon.maximum_concurrent_rpcs,
+                                  compression = compress_alg,
                                   options = [('grpc.keepalive_time_ms', 100000),
-                                             ('grpc.keepalive_timeout_ms', 500000)]
+                                             ('grpc.keepalive_timeout_ms', 500000),
+                                             ('grpc.max_send_message_length', config.axon.max_message_length),
+                                             ('grpc.max_receive_message_length', config.axon.max_message_length),
+                                             ('grpc.http2.max_frame_size', config.axon.max_frame_size),
+                                             ('grpc.http2.min_time_between_pings_ms', 10000),
+                                             ('grpc.http2.max_pings_without_data', 0),
+                                             ('grpc.so_reuseport', 1)]
                                 )
 
         synapses = {}
@@ -168,10 +209,10 @@ class axon:
             priority_threadpool = priority_threadpool,
             forward_timeout = config.axon.forward_timeout,
             backward_timeout = config.axon.backward_timeout,
+            compression = compress_alg,
+            compression_threshold = config.axon.compression_threshold,
         )
         bittensor.grpc.add_BittensorServicer_to_server( axon_instance, server )
-        full_address = str( config.axon.ip ) + ":" + str( config.axon.port )
-        server.add_insecure_port( full_address )
         return axon_instance 
 
     @classmethod   
@@ -207,6 +248,13 @@ class axon:
                         The grpc server distributes new worker threads to service requests up to this number.''', default = bittensor.defaults.axon.max_workers)
             parser.add_argument('--' + prefix_str + 'axon.maximum_concurrent_rpcs', type=int, 
                 help='''Maximum number of allowed active connections''',  default = bittensor.defaults.axon.maximum_concurrent_rpcs)
+            parser.add_argument('--' + prefix_str + 'axon.max_inflight', type=int, 
+                help='''Maximum number of admitted requests, new requests are rejected with UNAVAILABLE above this number.
+                        Only takes effect when set below axon.maximum_concurrent_rpcs, which grpc already enforces''',  default = bittensor.defaults.axon.max_inflight)
+            parser.add_argument('--' + prefix_str + 'axon.max_message_length', type=int, 
+                help='''Maximum size in bytes of a tensor message sent or received by this endpoint''',  default = bittensor.defaults.axon.max_message_length)
+            parser.add_argument('--' + prefix_str + 'axon.max_frame_size', type=int, 
+                help='''Maximum HTTP/2 frame size in bytes, at most 16777215''',  default = bittensor.defaults.axon.max_frame_size)
             parser.add_argument('--' + prefix_str + 'axon.backward_timeout', type=int,
                 help='Number of seconds to wait for backward axon request', default=2*bittensor.__blocktime__)
             parser.add_argument('--' + prefix_str + 'axon.forward_timeout', type=int,
@@ -215,8 +263,16 @@ class axon:
                 help='''maximum number of threads in thread pool''', default = bittensor.defaults.axon.priority.max_workers)
             parser.add_argument('--' + prefix_str + 'axon.priority.maxsize', type=int, 
                 help='''maximum size of tasks in priority queue''', default = bittensor.defaults.axon.priority.maxsize)
+            parser.add_argument('--' + prefix_str + 'axon.priority.aging_rate', type=float, 
+                help='''priority gained per second a task waits in the queue, prevents starvation of low priority tasks.
+                        Priorities are usually caller stake, so this is stake per second; 0 disables aging''', default = bittensor.defaults.axon.priority.aging_rate)
             parser.add_argument('--' + prefix_str + 'axon.compression', type=str, 
-                help='''Which compression algorithm to use for compression (gzip, deflate, NoCompression) ''', default = bittensor.defaults.axon.compression)
+                help='''Which compression algorithm to use for outbound responses (gzip, deflate, NoCompression).
+                        Inbound requests are decompressed with whichever supported algorithm the client used.''', default = bittensor.defaults.axon.compression)
+            parser.add_argument('--' + prefix_str + 'axon.compression_threshold', type=int, 
+                help='''Responses smaller than this many bytes are sent uncompressed''', default = bittensor.defaults.axon.compression_threshold)
+            parser.add_argument('--' + prefix_str + 'axon.verify_timeout', type=float, 
+                help='''Seconds a request waits for signature verification before it is rejected with UNAVAILABLE''', default = bittensor.defaults.axon.verify_timeout)
         except argparse.ArgumentError:
             # re-parsing arguments.
             pass
@@ -228,32 +284,36 @@ class axon:
         """ Adds parser defaults to object from enviroment variables.
         """
         defaults.axon = bittensor.config()
-        defaults.axon.port = os.getenv('BT_AXON_PORT') if os.getenv('BT_AXON_PORT') != None else 8091
-        defaults.axon.ip = os.getenv('BT_AXON_IP') if os.getenv('BT_AXON_IP') != None else '[::]'
-        defaults.axon.max_workers = os.getenv('BT_AXON_MAX_WORERS') if os.getenv('BT_AXON_MAX_WORERS') != None else 10
-        defaults.axon.maximum_concurrent_rpcs = os.getenv('BT_AXON_MAXIMUM_CONCURRENT_RPCS') if os.getenv('BT_AXON_MAXIMUM_CONCURRENT_RPCS') != None else 400
+        defaults.axon.port = _env('BT_AXON_PORT', 8091, int)
+        defaults.axon.ip = _env('BT_AXON_IP', '[::]', str)
+        defaults.axon.max_workers = _env('BT_AXON_MAX_WORKERS', 10, int)
+        defaults.axon.maximum_concurrent_rpcs = _env('BT_AXON_MAXIMUM_CONCURRENT_RPCS', 400, int)
+        defaults.axon.max_inflight = _env('BT_AXON_MAX_INFLIGHT', 400, int)
+        defaults.axon.max_message_length = _env('BT_AXON_MAX_MESSAGE_LENGTH', 512 * 1024 * 1024, int)
+        defaults.axon.max_frame_size = _env('BT_AXON_MAX_FRAME_SIZE', 16 * 1024 * 1024 - 1, int)
         
         defaults.axon.priority = bittensor.config()
-        defaults.axon.priority.max_workers = os.getenv('BT_AXON_PRIORITY_MAX_WORKERS') if os.getenv('BT_AXON_PRIORITY_MAX_WORKERS') != None else 10
-        defaults.axon.priority.maxsize = os.getenv('BT_AXON_PRIORITY_MAXSIZE') if os.getenv('BT_AXON_PRIORITY_MAXSIZE') != None else -1
+        defaults.axon.priority.max_workers = _env('BT_AXON_PRIORITY_MAX_WORKERS', 10, int)
+        defaults.axon.priority.maxsize = _env('BT_AXON_PRIORITY_MAXSIZE', -1, int)
+        defaults.axon.priority.aging_rate = _env('BT_AXON_PRIORITY_AGING_RATE', 0, float)
 
         defaults.axon.compression = 'NoCompression'
+        defaults.axon.compression_threshold = 8192
+        defaults.axon.verify_timeout = _env('BT_AXON_VERIFY_TIMEOUT', 5, float)
 
     @classmethod   
     def check_config(cls, config: 'bittensor.Config' ):
         """ Check config for axon port and wallet
         """
         assert config.axon.port > 1024 and config.axon.port < 65535, 'port must be in range [1024, 65535]'
+        assert config.axon.max_inflight > 0, 'axon.max_inflight must be positive'
         bittensor.wallet.check_config( config )
 
     @classmethod   
     def default_synapse_check(cls, synapse, hotkey ):
         """ default synapse check function
         """
-        if len(hotkey) == bittensor.__ss58_address_length__:
-            return True
-        
-        return False
+        return len(hotkey) == _SS58_LEN
 
     @staticmethod
     def check_backward_callback( backward_callback:Callable, pubkey:str = '_' ):
@@ -261,12 +321,13 @@ class axon:
         """
         if not inspect.ismethod(backward_callback) and not inspect.isfunction(backward_callback):
             raise ValueError('The axon backward callback must be a function with signature Callable[inputs_x:torch.FloatTensor, grads_dy:torch.FloatTensor ) -> torch.FloatTensor:, got {}'.format(backward_callback))        
-        if len( inspect.signature(backward_callback).parameters) != 3:
-            raise ValueError('The axon backward callback must have signature Callable[ inputs_x:torch.FloatTensor, grads_dy:torch.FloatTensor, synapses ) -> torch.FloatTensor:, got {}'.format(inspect.signature(backward_callback)))
-        if 'inputs_x' not in inspect.signature(backward_callback).parameters:
-            raise ValueError('The axon backward callback must have signature Callable[inputs_x:torch.FloatTensor, grads_dy:torch.FloatTensor ) -> torch.FloatTensor:, got {}'.format(inspect.signature(backward_callback)))
-        if 'grads_dy' not in inspect.signature(backward_callback).parameters:
-            raise ValueError('The axon backward callback must have signature Callable[inputs_x:torch.FloatTensor, grads_dy:torch.FloatTensor ) -> torch.FloatTensor:, got {}'.format(inspect.signature(backward_callback)))
+        signature = inspect.signature(backward_callback)
+        if len( signature.parameters) != 3:
+            raise ValueError('The axon backward callback must have signature Callable[ inputs_x:torch.FloatTensor, grads_dy:torch.FloatTensor, synapses ) -> torch.FloatTensor:, got {}'.format(signature))
+        if 'inputs_x' not in signature.parameters:
+            raise ValueError('The axon backward callback must have signature Callable[inputs_x:torch.FloatTensor, grads_dy:torch.FloatTensor ) -> torch.FloatTensor:, got {}'.format(signature))
+        if 'grads_dy' not in signature.parameters:
+            raise ValueError('The axon backward callback must have signature Callable[inputs_x:torch.FloatTensor, grads_dy:torch.FloatTensor ) -> torch.FloatTensor:, got {}'.format(signature))
  
 
     @staticmethod
@@ -275,90 +336,257 @@ class axon:
         """
         if not inspect.ismethod(forward_callback) and not inspect.isfunction(forward_callback):
             raise ValueError('The axon forward callback must be a function with signature Callable[inputs_x: torch.Tensor] -> torch.FloatTensor:, got {}'.format(forward_callback))   
-        if len( inspect.signature(forward_callback).parameters) != 3:
-            raise ValueError('The axon forward callback must have signature Callable[ inputs_x: torch.Tensor, synapses, hotkey] -> torch.FloatTensor:, got {}'.format(inspect.signature(forward_callback)))
-        if 'inputs_x' not in inspect.signature(forward_callback).parameters:
-            raise ValueError('The axon forward callback must have signature Callable[ inputs_x: torch.Tensor] -> torch.FloatTensor:, got {}'.format(inspect.signature(forward_callback)))
+        signature = inspect.signature(forward_callback)
+        if len( signature.parameters) != 3:
+            raise ValueError('The axon forward callback must have signature Callable[ inputs_x: torch.Tensor, synapses, hotkey] -> torch.FloatTensor:, got {}'.format(signature))
+        if 'inputs_x' not in signature.parameters:
+            raise ValueError('The axon forward callback must have signature Callable[ inputs_x: torch.Tensor] -> torch.FloatTensor:, got {}'.format(signature))
         
         sample_input = torch.randint(0,1,(3, 3))
         forward_callback([sample_input], synapses, hotkey='')
 
+# Behavior attribute and handler constructor for each ( request_streaming, response_streaming ) shape.
+_HANDLER_SHAPES = {
+    ( False, False ): ( 'unary_unary', grpc.unary_unary_rpc_method_handler ),
+    ( False, True ): ( 'unary_stream', grpc.unary_stream_rpc_method_handler ),
+    ( True, False ): ( 'stream_unary', grpc.stream_unary_rpc_method_handler ),
+    ( True, True ): ( 'stream_stream', grpc.stream_stream_rpc_method_handler ),
+}
+
+def _wrap_handler( handler: grpc.RpcMethodHandler, wrap: Callable ) -> grpc.RpcMethodHandler:
+    r""" Rebuilds the handler with wrap applied to its behavior, keeping its streaming shape and serializers.
+    """
+    behavior, rpc_method_handler = _HANDLER_SHAPES[ ( bool(handler.request_streaming), bool(handler.response_streaming) ) ]
+    return rpc_method_handler(
+        wrap( getattr( handler, behavior ) ),
+        request_deserializer = handler.request_deserializer,
+        response_serializer = handler.response_serializer
+    )
+
+class LoadSheddingInterceptor(grpc.ServerInterceptor):
+    """ Creates a new server interceptor that rejects requests with UNAVAILABLE once too many are in flight.
+    """
+    def __init__(self, limit:int = 400):
+        r""" Creates a new server interceptor that rejects requests with UNAVAILABLE once too many are in flight.
+        Args:
+            limit (int, `optional`):
+                maximum number of admitted requests which have not yet completed.
+        """
+        super().__init__()
+        self.limit = limit
+        self._admitted = 0
+        self._released = deque()
+        self._lock = threading.Lock()
+        def overloaded(_, context):
+            context.abort(grpc.StatusCode.UNAVAILABLE, 'overloaded')
+
+        self._overloaded = grpc.unary_unary_rpc_method_handler(overloaded)
+
+    @property
+    def inflight(self) -> int:
+        r""" Number of admitted requests which have not yet completed.
+        """
+        with self._lock:
+            return self._inflight()
+
+    def _inflight(self) -> int:
+        # Must hold self._lock.
+        while self._released:
+            self._released.popleft()
+            self._admitted -= 1
+        return self._admitted
+
+    def intercept_service(self, continuation, handler_call_details):
+        r""" Admits the request if there is capacity, otherwise rejects it before any further interceptors run.
+        """
+        with self._lock:
+            if self._inflight() >= self.limit:
+                return self._overloaded
+            self._admitted += 1
+
+        slot = _InflightSlot( self )
+        try:
+            handler = continuation(handler_call_details)
+        except:
+            slot.release()
+            raise
+        if handler == None:
+            slot.release()
+            return None
+
+        def admitted( behavior ):
+            if handler.response_streaming:
+                # The behavior returns the response iterator, the call is in flight until it is exhausted or closed.
+                def _behavior( request, context ):
+                    try:
+                        yield from behavior( request, context )
+                    finally:
+                        slot.release()
+            else:
+                def _behavior( request, context ):
+                    try:
+                        return behavior( request, context )
+                    finally:
+                        slot.release()
+            return _behavior
+
+        return _wrap_handler( handler, admitted )
+
+class _InflightSlot:
+    r""" A single admission in a LoadSheddingInterceptor, released once when the call completes.
+        Calls which never reach the handler (cancelled, undecodable, rejected by grpc) release it when collected.
+    """
+    def __init__(self, interceptor: 'LoadSheddingInterceptor'):
+        self.interceptor = interceptor
+        self.released = False
+
+    def release(self):
+        # Lock free, as release also runs as a finalizer. A garbage collection pass can run it on a
+        # thread which already holds the interceptor's lock, so it only appends to a deque (atomic)
+        # which the interceptor drains under its lock.
+        if not self.released:
+            self.released = True
+            self.interceptor._released.append( None )
+
+    __del__ = release
+
 class AuthInterceptor(grpc.ServerInterceptor):
     """ Creates a new server interceptor that authenticates incoming messages from passed arguments.
     """
-    def __init__(self, key:str = 'Bittensor',blacklist:List = []):
+    def __init__(self, key:str = 'Bittensor',blacklist:List = [], verify_timeout:float = 5):
         r""" Creates a new server interceptor that authenticates incoming messages from passed arguments.
         Args:
             key (str, `optional`):
                  key for authentication header in the metadata (default= Bittensor)
             black_list (Fucntion, `optional`): 
                 black list function that prevents certain pubkeys from sending messages
+            verify_timeout (float, `optional`):
+                seconds to wait on a busy verification pool before rejecting the request as unavailable
         """
         super().__init__()
-        self._valid_metadata = ('rpc-auth-header', key)
-        self.nounce_dic = {}
-        self.message = 'Invalid key'
+        self._valid_key = 'rpc-auth-header'
+        self._valid_value = key
+        # LRU of the last nounce seen per endpoint, bounded so it cannot grow without limit.
+        self.nounce_dic = OrderedDict()
+        self._nounce_cap = 100_000
+        # LRU of Keypairs per pubkey, saves decoding the ss58 address on every request.
+        self._keypair_cache = OrderedDict()
+        self._keypair_cap = 4096
+        self._cache_lock = threading.Lock()
+        # Signatures are verified on a dedicated pool rather than on the grpc polling thread,
+        # the worker thread servicing the call waits on the result before running the handler.
+        self._verify_pool = futures.ThreadPoolExecutor( max_workers = os.cpu_count() )
+        self._verify_timeout = verify_timeout
         self.blacklist = blacklist
-        def deny(_, context):
-            context.abort(grpc.StatusCode.UNAUTHENTICATED, self.message)
-
-        self._deny = grpc.unary_unary_rpc_method_handler(deny)
 
     def intercept_service(self, continuation, handler_call_details):
         r""" Authentication between bittensor nodes. Intercepts messages and checks them
         """
-        meta = handler_call_details.invocation_metadata
+        meta = dict( handler_call_details.invocation_metadata )
 
         try: 
             #version checking
             self.version_checking(meta)
 
-            #signature checking
-            self.signature_checking(meta)
-
-            #blacklist checking
-            self.black_list_checking(meta)
+            variable_length_messages = meta['bittensor-signature'].split('bitxx', 3)
 
-            return continuation(handler_call_details)
+            #signature then blacklist checking, the blacklist only sees pubkeys which signed the request
+            verification = self._verify_pool.submit( self._authenticate, meta, variable_length_messages )
 
         except Exception as e:
-            self.message = str(e)
-            return self._deny
+            return self._deny( continuation(handler_call_details), str(e) )
+
+        return self._verified_handler( continuation(handler_call_details), verification )
+
+    @staticmethod
+    def _deny( handler, message ):
+        r""" Returns a handler of the same streaming shape as the passed handler which aborts the call
+            as unauthenticated with the passed message. Built per failure so concurrent rejections never share mutable state.
+        """
+        def deny(_, context):
+            context.abort(grpc.StatusCode.UNAUTHENTICATED, message)
 
+        if handler == None:
+            return grpc.unary_unary_rpc_method_handler(deny)
+        return _wrap_handler( handler, lambda behavior: deny )
 
-    def vertification(self,meta):
-        r"""vertification of signature in metadata. Uses the pubkey and nounce
+    def _authenticate(self, meta, variable_length_messages):
+        r""" Checks the signature and then the blacklist, so the blacklist is never called for a forged pubkey.
+        """
+        self.signature_checking(variable_length_messages)
+        self.black_list_checking(meta, variable_length_messages)
+
+    def _verified_handler(self, handler, verification):
+        r""" Wraps the handler so the call is aborted unless the signature and blacklist checks succeed.
+        """
+        if handler == None:
+            return None
+
+        def verified( behavior ):
+            def _behavior( request, context ):
+                try:
+                    verification.result( timeout = self._verify_timeout )
+                except futures.TimeoutError:
+                    # The verification pool is saturated, the caller may retry.
+                    context.abort( grpc.StatusCode.UNAVAILABLE, 'Signature verification timed out' )
+                except Exception as e:
+                    context.abort( grpc.StatusCode.UNAUTHENTICATED, str(e) )
+                return behavior( request, context )
+            return _behavior
+
+        return _wrap_handler( handler, verified )
+
+
+    def vertification(self,variable_length_messages):
+        r"""vertification of the split signature metadata. Uses the pubkey and nounce
         """
-        variable_length_messages = meta[1].value.split('bitxx')
         nounce = int(variable_length_messages[0])
         pubkey = variable_length_messages[1]
         message = variable_length_messages[2]
         unique_receptor_uid = variable_length_messages[3]
-        _keypair = Keypair(ss58_address=pubkey)
+        _keypair = self._get_keypair( pubkey )
+        signed_message = "{}{}{}".format( nounce, pubkey, unique_receptor_uid ).encode()
 
-        # Unique key that specifies the endpoint.
-        endpoint_key = str(pubkey) + str(unique_receptor_uid)
+        # Unique key that specifies the endpoint, both parts are already strings from the split.
+        endpoint_key = pubkey + unique_receptor_uid
         
         #checking the time of creation, compared to previous messages
-        if endpoint_key in self.nounce_dic.keys():
-            prev_data_time = self.nounce_dic[ endpoint_key ]
-            if nounce - prev_data_time > -10:
-                self.nounce_dic[ endpoint_key ] = nounce
-
-                #decrypting the message and verify that message is correct
-                verification = _keypair.verify( str(nounce) + str(pubkey) + str(unique_receptor_uid), message)
+        with self._cache_lock:
+            if endpoint_key in self.nounce_dic:
+                self.nounce_dic.move_to_end( endpoint_key )
+                prev_data_time = self.nounce_dic[ endpoint_key ]
+                if nounce - prev_data_time > -10:
+                    self.nounce_dic[ endpoint_key ] = nounce
+                else:
+                    return False
             else:
-                verification = False
-        else:
-            self.nounce_dic[ endpoint_key ] = nounce
-            verification = _keypair.verify( str( nounce ) + str(pubkey) + str(unique_receptor_uid), message)
+                self.nounce_dic[ endpoint_key ] = nounce
+                if len( self.nounce_dic ) > self._nounce_cap:
+                    self.nounce_dic.popitem( last = False )
 
-        return verification
+        #decrypting the message and verify that message is correct
+        return _keypair.verify( signed_message, message )
 
-    def signature_checking(self,meta):
+    def _get_keypair(self, pubkey):
+        r""" Returns the cached Keypair for the pubkey, creating it on a miss.
+        """
+        with self._cache_lock:
+            _keypair = self._keypair_cache.get( pubkey )
+            if _keypair != None:
+                self._keypair_cache.move_to_end( pubkey )
+                return _keypair
+
+        _keypair = Keypair( ss58_address = pubkey )
+        with self._cache_lock:
+            self._keypair_cache[ pubkey ] = _keypair
+            if len( self._keypair_cache ) > self._keypair_cap:
+                self._keypair_cache.popitem( last = False )
+        return _keypair
+
+    def signature_checking(self,variable_length_messages):
         r""" Calls the vertification of the signature and raises an error if failed
         """
-        if self.vertification(meta):
+        if self.vertification(variable_length_messages):
             pass
         else:
             raise Exception('Incorrect Signature')
@@ -366,20 +594,17 @@ class AuthInterceptor(grpc.ServerInterceptor):
     def version_checking(self,meta):
         r""" Checks the header and version in the metadata
         """
-        if meta[0] == self._valid_metadata:
-            pass
-        else:
+        if meta.get(self._valid_key) != self._valid_value:
             raise Exception('Incorrect Metadata format')
 
-    def black_list_checking(self,meta):
+    def black_list_checking(self,meta,variable_length_messages):
         r"""Tries to call to blacklist function in the miner and checks if it should blacklist the pubkey 
         """
-        variable_length_messages = meta[1].value.split('bitxx')
         pubkey = variable_length_messages[1]
         
         if self.blacklist == None:
             pass
-        elif self.blacklist(pubkey,int(meta[3].value)):
+        elif self.blacklist(pubkey,int(meta['request_type'])):
             raise Exception('Black listed')
         else:
             pass
@@ -52,6 +52,8 @@ class Axon( bittensor.grpc.BittensorServicer ):
         priority_threadpool: 'bittensor.prioritythreadpool' = None,
         forward_timeout: int = None,
         backward_timeout: int = None,
+        compression: 'grpc.Compression' = grpc.Compression.NoCompression,
+        compression_threshold: int = 0,
     ):
         r""" Initializes a new Axon tensor processing endpoint.
             
@@ -70,6 +72,10 @@ class Axon( bittensor.grpc.BittensorServicer ):
                     function to assign priority on requests.
                 priority_threadpool (:obj:`bittensor.prioritythreadpool`, `optional`):
                     bittensor priority_threadpool.                
+                compression (:obj:`grpc.Compression`, `optional`):
+                    compression algorithm the server applies to responses.
+                compression_threshold (:type:`int`, `optional`):
+                    responses smaller than this many bytes are sent uncompressed.
         """
         self.ip = ip
         self.port = port
@@ -79,10 +85,13 @@ class Axon( bittensor.grpc.BittensorServicer ):
         self.backward_callback = backward if backward != None else self.default_backward_callback
         self.forward_timeout = forward_timeout
         self.backward_timeout = backward_timeout
+        self.compression = compression
+        self.compression_threshold = compression_threshold
         self.synapse_callbacks = synapses
         self.synapse_checks = synapse_checks
         self.stats = self._init_stats()
         self.started = None
+        self.bound = False
         self.optimizer_step = None
         
         # -- Priority 
@@ -120,6 +129,7 @@ class Axon( bittensor.grpc.BittensorServicer ):
             requires_grad = request.requires_grad,
             synapses = synapses,
         )
+        self._skip_compression_for_small_response( response, context )
         return response
 
     def Backward( self, request: bittensor.proto.TensorMessage, context: grpc.ServicerContext ) -> bittensor.proto.TensorMessage:
@@ -147,8 +157,16 @@ class Axon( bittensor.grpc.BittensorServicer ):
             requires_grad = request.requires_grad,
             synapses = synapses
         )
+        self._skip_compression_for_small_response( response, context )
         return response
 
+    def _skip_compression_for_small_response( self, response: bittensor.proto.TensorMessage, context: grpc.ServicerContext ):
+        r""" Sends the response uncompressed when it is below the compression threshold,
+            compressing small payloads costs more cpu than it saves on the wire.
+        """
+        if self.compression != grpc.Compression.NoCompression and response.ByteSize() < self.compression_threshold:
+            context.set_compression( grpc.Compression.NoCompression )
+
     def _forward(self, request):
         r""" Performs validity checks on the grpc request before passing the tensors to the forward queue.
             Returns the outputs and synapses from the backend forward call.
@@ -748,6 +766,13 @@ class Axon( bittensor.grpc.BittensorServicer ):
             self.server.stop( grace = 1 )  
             logger.success("Axon Stopped:".ljust(20) + "<blue>{}</blue>", self.ip + ':' + str(self.port))
 
+        # The port is bound on first start rather than on construction, so an axon which is never started holds no socket.
+        if not self.bound:
+            full_address = str( self.ip ) + ":" + str( self.port )
+            if self.server.add_insecure_port( full_address ) == 0:
+                raise RuntimeError('Axon failed to bind to {}'.format( full_address ))
+            self.bound = True
+
         self.server.start()
         logger.success("Axon Started:".ljust(20) + "<blue>{}</blue>", self.ip + ':' + str(self.port))
         self.started = True
@@ -31,6 +31,7 @@ class prioritythreadpool:
             config: 'bittensor.config' = None,
             max_workers: int = None,
             maxsize: int = None,
+            aging_rate: float = None,
         ):
         r""" Initializes a priority thread pool.
             Args:
@@ -40,16 +41,19 @@ class prioritythreadpool:
 .                   The maximum number of threads in thread pool
                 maxsize (default=-1, type=int)
                     The maximum number of tasks in the priority queue
+                aging_rate (default=0, type=float)
+                    Priority gained per second spent waiting in the queue
         """        
         if config == None: 
             config = prioritythreadpool.config()
         config = copy.deepcopy( config )
         config.axon.priority.max_workers = max_workers if max_workers != None else config.axon.priority.max_workers
         config.axon.priority.maxsize = maxsize if maxsize != None else config.axon.priority.maxsize
+        config.axon.priority.aging_rate = aging_rate if aging_rate != None else config.axon.priority.aging_rate
 
         prioritythreadpool.check_config( config )
 
-        return priority_thread_pool_impl.PriorityThreadPoolExecutor(maxsize = config.axon.priority.maxsize, max_workers = config.axon.priority.max_workers)
+        return priority_thread_pool_impl.PriorityThreadPoolExecutor(maxsize = config.axon.priority.maxsize, max_workers = config.axon.priority.max_workers, aging_rate = config.axon.priority.aging_rate)
 
     @classmethod
     def add_args(cls, parser: argparse.ArgumentParser, prefix: str = None ):
@@ -59,6 +63,8 @@ class prioritythreadpool:
         try:
             parser.add_argument('--' + prefix_str + 'axon.priority.max_workers', type = int, help='''maximum number of threads in thread pool''', default = bittensor.defaults.axon.priority.max_workers)
             parser.add_argument('--' + prefix_str + 'axon.priority.maxsize', type=int, help='''maximum size of tasks in priority queue''', default = bittensor.defaults.axon.priority.maxsize)  
+            parser.add_argument('--' + prefix_str + 'axon.priority.aging_rate', type=float, help='''priority gained per second a task waits in the queue, prevents starvation of low priority tasks.
+                        Priorities are usually caller stake, so this is stake per second; 0 disables aging''', default = bittensor.defaults.axon.priority.aging_rate)
         except argparse.ArgumentError:
             # re-parsing arguments.
             pass
@@ -80,6 +86,7 @@ class prioritythreadpool:
         defaults.axon.priority = bittensor.Config()
         defaults.axon.priority.max_workers = os.getenv('BT_AXON_PRIORITY_MAX_WORKERS') if os.getenv('BT_AXON_PRIORITY_MAX_WORKERS') != None else 5
         defaults.axon.priority.maxsize = os.getenv('BT_AXON_PRIORITY_MAXSIZE') if os.getenv('BT_AXON_PRIORITY_MAXSIZE') != None else 10
+        defaults.axon.priority.aging_rate = float(os.getenv('BT_AXON_PRIORITY_AGING_RATE')) if os.getenv('BT_AXON_PRIORITY_AGING_RATE') != None else 0
     
     @classmethod   
     def config(cls) -> 'bittensor.Config':
@@ -96,3 +103,4 @@ class prioritythreadpool:
         """
         assert isinstance(config.axon.priority.max_workers, int), 'axon.priority.max_workers must be a int'
         assert isinstance(config.axon.priority.maxsize, int), 'axon.priority.maxsize must be a int'
+        assert config.axon.priority.aging_rate >= 0, 'axon.priority.aging_rate must be non-negative'
@@ -117,11 +117,13 @@ class PriorityThreadPoolExecutor(_base.Executor):
     _counter = itertools.count().__next__
 
     def __init__(self, maxsize = -1, max_workers=None, thread_name_prefix='',
-                 initializer=None, initargs=()):
+                 initializer=None, initargs=(), aging_rate = 0):
         """Initializes a new ThreadPoolExecutor instance.
         Args:
             max_workers: The maximum number of threads that can be used to
                 execute the given calls.
+            aging_rate: Priority gained per second a task waits in the queue,
+                so low priority tasks are not starved by a burst of high ones.
             thread_name_prefix: An optional name prefix to give our threads.
             initializer: An callable used to initialize worker threads.
             initargs: A tuple of arguments to pass to the initializer.
@@ -147,6 +149,8 @@ class PriorityThreadPoolExecutor(_base.Executor):
                                     ("ThreadPoolExecutor-%d" % self._counter()))
         self._initializer = initializer
         self._initargs = initargs
+        self._aging_rate = aging_rate
+        self._epoch = time.time()
 
     def submit(self, fn, *args, **kwargs):
         with self._shutdown_lock:
@@ -170,7 +174,10 @@ class PriorityThreadPoolExecutor(_base.Executor):
             f = _base.Future()
             w = _WorkItem(f, fn, start_time, args, kwargs)
 
-            self._work_queue.put((-float(priority + eplison), w), block=False)
+            # Aging: a task submitted later is penalised by the time elapsed, which ranks the same
+            # as every queued task gaining aging_rate priority per second while it waits.
+            age_penalty = self._aging_rate * (start_time - self._epoch)
+            self._work_queue.put((-float(priority + eplison) + age_penalty, w), block=False)
             self._adjust_thread_count()
             return f
     submit.__doc__ = _base.Executor.submit.__doc__
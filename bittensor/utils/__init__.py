@@ -1,11 +1,14 @@
 import binascii
+import concurrent.futures
 import datetime
+import functools
 import hashlib
 import math
 import multiprocessing
 import numbers
 import os
 import random
+import struct
 import time
 from dataclasses import dataclass
 from queue import Empty
@@ -13,11 +16,11 @@ from typing import Any, Dict, Optional, Tuple, Union
 
 import backoff
 import bittensor
+import numpy as np
 import pandas
 import requests
 import torch
 from Crypto.Hash import keccak
-from substrateinterface import Keypair
 from substrateinterface.utils import ss58
 
 from .register_cuda import reset_cuda, solve_cuda
@@ -38,18 +41,15 @@ def indexed_values_to_dataframe (
         raise ValueError('Passed uids must have type list or torch.Tensor')
     if not isinstance(values, list) and not isinstance(values, torch.Tensor):
         raise ValueError('Passed values must have type list or torch.Tensor')
-    if not isinstance(index, list):
-        index = index.tolist()
-    if not isinstance(values, list):
-        values = values.tolist()
-
-    index = [ idx_i for idx_i in index if idx_i < len(values) and idx_i >= 0 ]
-    dataframe = pandas.DataFrame(columns=[prefix], index = index )
-    for idx_i in index:
-        value_i = values[ idx_i ]
-        if value_i > 0 or not filter_zeros:
-            dataframe.loc[idx_i] = pandas.Series( { str(prefix): value_i } )
-    return dataframe
+    index = np.asarray( index, dtype = np.int64 ) if isinstance(index, list) else index.detach().to( device = 'cpu', dtype = torch.int64 ).numpy()
+    values = np.asarray( values ) if isinstance(values, list) else values.detach().cpu().numpy()
+
+    # Build the column in one shot, filtered zeros are left as NaN rows.
+    index = index[ (index >= 0) & (index < len(values)) ]
+    column = values[ index ]
+    if filter_zeros:
+        column = np.where( column > 0, column, np.nan )
+    return pandas.DataFrame( { prefix: column }, index = index )
 
 def unbiased_topk( values, k, dim=0, sorted = True, largest = True):
     r""" Selects topk as in torch.topk but does not bias lower indices when values are equal.
@@ -65,38 +65,49 @@ def unbiased_topk( values, k, dim=0, sorted = True, largest = True):
             indices: (torch.LongTensor)
                 indices of the topk values.
     """
-    permutation = torch.randperm(values.shape[ dim ])
-    permuted_values = values[ permutation ]
-    topk, indices = torch.topk( permuted_values,  k, dim = dim, sorted=sorted, largest=largest )
-    return topk, permutation[ indices ]
+    if values.dim() != 1:
+        permutation = torch.randperm(values.shape[ dim ])
+        permuted_values = values[ permutation ]
+        topk, indices = torch.topk( permuted_values,  k, dim = dim, sorted=sorted, largest=largest )
+        return topk, permutation[ indices ]
+
+    topk, indices = torch.topk( values,  k, dim = dim, sorted=sorted, largest=largest )
+    if k == 0:
+        return topk, indices
+
+    # Only values tied with the k-th value can be biased, everything better is always selected.
+    # Draw the remaining slots uniformly from all positions holding the k-th value.
+    boundary = topk.min() if largest else topk.max()
+    tied = ( values == boundary ).nonzero().squeeze( 1 )
+    strict = topk != boundary
+    num_tied = k - int( strict.sum() )
+    if tied.numel() == num_tied:
+        return topk, indices
+
+    chosen = tied[ torch.randperm( tied.numel(), device = tied.device )[ :num_tied ] ]
+    indices = torch.cat( ( indices[ strict ], chosen ) )
+    return values[ indices ], indices
 
 def hex_bytes_to_u8_list( hex_bytes: bytes ):
     hex_chunks = [int(hex_bytes[i:i+2], 16) for i in range(0, len(hex_bytes), 2)]
     return hex_chunks
 
 def u8_list_to_hex( values: list ):
-    total = 0
-    for val in reversed(values):
-        total = (total << 8) + val
-    return total 
+    # Little endian, the first value is the least significant byte.
+    return int.from_bytes( bytes(values), 'little' )
 
 def create_seal_hash( block_hash:bytes, nonce:int ) -> bytes:
-    block_bytes = block_hash.encode('utf-8')[2:]
-    nonce_bytes = binascii.hexlify(nonce.to_bytes(8, 'little'))
-    pre_seal = nonce_bytes + block_bytes
-    seal_sh256 = hashlib.sha256( bytearray(hex_bytes_to_u8_list(pre_seal)) ).digest()
-    kec = keccak.new(digest_bits=256)
-    seal = kec.update( seal_sh256 ).digest()
+    # The seal hashes the raw little endian nonce followed by the raw block hash.
+    pre_seal = nonce.to_bytes(8, 'little') + bytes.fromhex( block_hash[2:] )
+    seal_sh256 = hashlib.sha256( pre_seal ).digest()
+    seal = keccak.new( digest_bits=256, data=seal_sh256 ).digest()
     return seal
 
 def seal_meets_difficulty( seal:bytes, difficulty:int ):
     seal_number = int.from_bytes(seal, "big")
-    product = seal_number * difficulty
     limit = int(math.pow(2,256))- 1
-    if product > limit:
-        return False
-    else:
-        return True
+    # seal * difficulty <= limit, without the 256 bit multiplication.
+    return seal_number <= limit // difficulty
     
 def solve_for_difficulty( block_hash, difficulty ):
     meets = False
@@ -153,7 +164,7 @@ class Solver(multiprocessing.Process):
             The number of nonces to try to solve before checking for a new block.
         best_queue: multiprocessing.Queue
             The queue to put the best nonce the process has found during the pow solve.
-            New nonces are added each update_interval.
+            New nonces are added after an update_interval which improved on the process's best.
         time_queue: multiprocessing.Queue
             The queue to put the time the process took to finish each update_interval.
             Used for calculating the average time per update_interval across all processes.
@@ -215,6 +226,8 @@ class Solver(multiprocessing.Process):
         self.check_block = check_block
         self.stopEvent = stopEvent
         self.limit = limit
+        # Best value this process has already sent on best_queue.
+        self.best_sent = float('inf')
 
     def run(self):
         block_number: int
@@ -229,7 +242,7 @@ class Solver(multiprocessing.Process):
             if self.newBlockEvent.is_set():
                 with self.check_block:
                     block_number = self.curr_block_num.value
-                    block_bytes = bytes(self.curr_block)
+                    block_bytes = bytes(self.curr_block.get_obj())
                     block_difficulty = registration_diff_unpack(self.curr_diff)
 
                 self.newBlockEvent.clear()
@@ -254,47 +267,53 @@ class Solver(multiprocessing.Process):
 def solve_for_nonce_block(solver: Solver, nonce_start: int, nonce_end: int, block_bytes: bytes, difficulty: int, limit: int, block_number: int) -> Tuple[Optional[POWSolution], int]:
     best_local = float('inf')
     best_seal_local = [0]*32
+    best_seal_number = float('inf')
+    # seal * difficulty < limit holds exactly when seal <= target, computed once for the whole range.
+    target = (limit - 1) // difficulty
     start = time.time()
+    # Decode the hex block hash once, each nonce only prepends its raw bytes.
+    block_raw = bytes.fromhex( block_bytes.decode('utf-8') )
+    # Local bindings skip the module attribute lookups on every nonce.
+    sha256 = hashlib.sha256
+    keccak_new = keccak.new
     for nonce in range(nonce_start, nonce_end):
-        # Create seal.
-        nonce_bytes = binascii.hexlify(nonce.to_bytes(8, 'little'))
-        pre_seal = nonce_bytes + block_bytes
-        seal_sh256 = hashlib.sha256( bytearray(hex_bytes_to_u8_list(pre_seal)) ).digest()
-        kec = keccak.new(digest_bits=256)
-        seal = kec.update( seal_sh256 ).digest()
+        # Create seal, the keccak state is absorbed on construction rather than with a separate update call.
+        pre_seal = nonce.to_bytes(8, 'little') + block_raw
+        seal = keccak_new( digest_bits=256, data=sha256( pre_seal ).digest() ).digest()
         seal_number = int.from_bytes(seal, "big")
 
         # Check if seal meets difficulty
-        product = seal_number * difficulty
-        if product < limit:
+        if seal_number <= target:
             # Found a solution, save it.
             return POWSolution(nonce, block_number, difficulty, seal), time.time() - start
 
-        if (product - limit) < best_local: 
-            best_local = product - limit
+        if seal_number < best_seal_number:
+            best_seal_number = seal_number
+            best_local = seal_number * difficulty - limit
             best_seal_local = seal
 
-    # Send best solution to best queue.
-    solver.best_queue.put((best_local, best_seal_local))
+    # Send best solution to best queue, only when it improves on what this solver already sent.
+    if best_local < solver.best_sent:
+        solver.best_sent = best_local
+        solver.best_queue.put((best_local, best_seal_local))
     return None, time.time() - start
 
 
 def registration_diff_unpack(packed_diff: multiprocessing.Array) -> int:
-    """Unpacks the packed two 32-bit integers into one 64-bit integer. Little endian."""
-    return int(packed_diff[0] << 32 | packed_diff[1])
+    """Unpacks the 64-bit difficulty from the first 8 bytes of the shared array. Little endian."""
+    return struct.unpack_from('<Q', packed_diff.get_obj(), 0)[0]
 
 
 def registration_diff_pack(diff: int, packed_diff: multiprocessing.Array):
-    """Packs the difficulty into two 32-bit integers. Little endian."""
-    packed_diff[0] = diff >> 32
-    packed_diff[1] = diff & 0xFFFFFFFF # low 32 bits
+    """Packs the difficulty as one 64-bit integer into the first 8 bytes of the shared array. Little endian."""
+    struct.pack_into('<Q', packed_diff.get_obj(), 0, diff)
 
 
 def update_curr_block(curr_diff: multiprocessing.Array, curr_block: multiprocessing.Array, curr_block_num: multiprocessing.Value, block_number: int, block_bytes: bytes, diff: int, lock: multiprocessing.Lock):
     with lock:
         curr_block_num.value = block_number
-        for i in range(64):
-            curr_block[i] = block_bytes[i]
+        # One slice copy under the array's own lock instead of 64 locked item writes.
+        curr_block[:] = block_bytes[:64]
         registration_diff_pack(diff, curr_diff)
 
 
@@ -331,9 +350,9 @@ def solve_for_difficulty_fast( subtensor, wallet, num_processes: Optional[int] =
     best_number: int
     best_number = float('inf')
 
-    curr_block = multiprocessing.Array('h', 64, lock=True) # byte array
+    curr_block = multiprocessing.Array('B', 64, lock=True) # byte array
     curr_block_num = multiprocessing.Value('i', 0, lock=True) # int
-    curr_diff = multiprocessing.Array('Q', [0, 0], lock=True) # [high, low]
+    curr_diff = multiprocessing.Array('B', 8, lock=True) # packed little endian uint64
     
     status.start()
 
@@ -372,7 +391,12 @@ def solve_for_difficulty_fast( subtensor, wallet, num_processes: Optional[int] =
     solution = None
     best_seal = None
     itrs_per_sec = 0
-    while not wallet.is_registered(subtensor):
+    # The registration check is a substrate query and the status is re-rendered by rich,
+    # both are refreshed at most once a second rather than on every pass of the loop.
+    refresh_interval = 1.0
+    registered = wallet.is_registered(subtensor)
+    last_refresh = time.time()
+    while not registered:
         # Wait until a solver finds a solution
         try:
             solution = solution_queue.get(block=True, timeout=0.25)
@@ -425,7 +449,11 @@ def solve_for_difficulty_fast( subtensor, wallet, num_processes: Optional[int] =
 
             except Empty:
                 break
-                
+
+        if time.time() - last_refresh < refresh_interval:
+            continue
+        last_refresh = time.time()
+
         message = f"""Solving 
             time spent: {time.time() - start_time}
             Difficulty: [bold white]{millify(difficulty)}[/bold white]
@@ -434,6 +462,7 @@ def solve_for_difficulty_fast( subtensor, wallet, num_processes: Optional[int] =
             Block_hash: [bold white]{block_hash.encode('utf-8')}[/bold white]
             Best: [bold white]{binascii.hexlify(bytes(best_seal) if best_seal else bytes(0))}[/bold white]"""
         status.update(message.replace(" ", "")) 
+        registered = wallet.is_registered(subtensor)
 
     # exited while, solution contains the nonce or wallet is registered
     stopEvent.set() # stop all other processes
@@ -503,54 +532,57 @@ def solve_for_difficulty_fast_cuda( subtensor: 'bittensor.Subtensor', wallet: 'b
     start_time = time.time()
     interval_time = start_time
 
+    # Checks registration in the background while the kernel runs. The block is still
+    # fetched after the kernel returns, so each launch hashes the newest block.
+    poller = concurrent.futures.ThreadPoolExecutor( max_workers = 1 )
+
     status.start()
-    while solution == -1 and not wallet.is_registered(subtensor):
-        solution, seal = solve_cuda(nonce,
-                        update_interval,
-                        TPB,
-                        block_bytes, 
-                        block_number,
-                        difficulty, 
-                        limit,
-                        dev_id)
-
-        if (solution != -1):
-            # Attempt to reset CUDA device
-            reset_cuda()
-            status.stop()
-            new_bn = subtensor.get_current_block()
-            print(f"Found solution for bn: {block_number}; Newest: {new_bn}")            
-            return POWSolution(solution, block_number, difficulty, seal)
-
-        nonce += (TPB * update_interval)
-        if (nonce >= int(math.pow(2,63))):
-            nonce = 0
-        itrs_per_sec = (TPB * update_interval) / (time.time() - interval_time)
-        interval_time = time.time()
-
-        block_number, difficulty, block_hash = get_block_with_retry(subtensor)
-        block_bytes = block_hash.encode('utf-8')[2:]
+    try:
+        registered = wallet.is_registered(subtensor)
+        while solution == -1 and not registered:
+            next_registered = poller.submit( wallet.is_registered, subtensor )
+            solution, seal = solve_cuda(nonce,
+                            update_interval,
+                            TPB,
+                            block_bytes, 
+                            block_number,
+                            difficulty, 
+                            limit,
+                            dev_id)
+            # Wait for the check before touching the subtensor again on this thread.
+            registered = next_registered.result()
+
+            if (solution != -1):
+                new_bn = subtensor.get_current_block()
+                print(f"Found solution for bn: {block_number}; Newest: {new_bn}")            
+                return POWSolution(solution, block_number, difficulty, seal)
+
+            nonce += (TPB * update_interval)
+            if (nonce >= int(math.pow(2,63))):
+                nonce = 0
+            itrs_per_sec = (TPB * update_interval) / (time.time() - interval_time)
+            interval_time = time.time()
+
+            block_number, difficulty, block_hash = get_block_with_retry(subtensor)
+            block_bytes = block_hash.encode('utf-8')[2:]
 
-        message = f"""Solving 
-            time spent: {datetime.timedelta(seconds=time.time() - start_time)}
-            Nonce: [bold white]{nonce}[/bold white]
-            Difficulty: [bold white]{millify(difficulty)}[/bold white]
-            Iters: [bold white]{get_human_readable(int(itrs_per_sec), "H")}/s[/bold white]
-            Block: [bold white]{block_number}[/bold white]
-            Block_hash: [bold white]{block_hash.encode('utf-8')}[/bold white]"""
-        status.update(message.replace(" ", ""))
-        
-    # exited while, found_solution contains the nonce or wallet is registered
-    if solution == -1: # didn't find solution
-        reset_cuda()
-        status.stop()
+            message = f"""Solving 
+                time spent: {datetime.timedelta(seconds=time.time() - start_time)}
+                Nonce: [bold white]{nonce}[/bold white]
+                Difficulty: [bold white]{millify(difficulty)}[/bold white]
+                Iters: [bold white]{get_human_readable(int(itrs_per_sec), "H")}/s[/bold white]
+                Block: [bold white]{block_number}[/bold white]
+                Block_hash: [bold white]{block_hash.encode('utf-8')}[/bold white]"""
+            status.update(message.replace(" ", ""))
+
+        # exited while, wallet is registered
         return None
-    
-    else:
+
+    finally:
+        poller.shutdown()
+        # Attempt to reset CUDA device
         reset_cuda()
-        # Shouldn't get here
         status.stop()
-        return None
 
 def create_pow( subtensor, wallet, cuda: bool = False, dev_id: int = 0, tpb: int = 256, num_processes: int = None, update_interval: int = None ) -> Optional[Dict[str, Any]]:
     if cuda:
@@ -574,6 +606,7 @@ def version_checking():
     if latest_version_as_int > bittensor.__version_as_int__:
         print('\u001b[31m Current Bittensor Version: {}, Latest Bittensor Version {} \n Please update to the latest version'.format(bittensor.__version__,latest_version))
 
+@functools.lru_cache( maxsize = 4096 )
 def is_valid_ss58_address( address: str ) -> bool:
     """
     Checks if the given address is a valid ss58 address.
@@ -610,13 +643,11 @@ def is_valid_ed25519_pubkey( public_key: Union[str, bytes] ) -> bool:
         else:
             raise ValueError( "public_key must be a string or bytes" )
 
-        keypair = Keypair(
-            public_key=public_key,
-            ss58_format=bittensor.__ss58_format__
-        )
-
-        ss58_addr = keypair.ss58_address
-        return ss58_addr is not None
+        # Any 32 bytes encode to an ss58 address, so decoding the hex is the whole check
+        # and there is no need to build a Keypair.
+        if isinstance( public_key, str ):
+            public_key = bytes.fromhex( public_key[2:] if public_key.startswith('0x') else public_key )
+        return len( public_key ) == 32
 
     except (ValueError, IndexError):
         return False
@@ -1,4 +1,3 @@
-import binascii
 import hashlib
 import math
 from typing import Tuple
@@ -48,16 +47,11 @@ def solve_cuda(nonce_start: np.int64, update_interval: np.int64, TPB: int, block
 
         return product < limit
 
-    def hex_bytes_to_u8_list( hex_bytes: bytes ):
-        hex_chunks = [int(hex_bytes[i:i+2], 16) for i in range(0, len(hex_bytes), 2)]
-        return hex_chunks
-
     def create_seal_hash( block_bytes:bytes, nonce:int ) -> bytes:
-        nonce_bytes = binascii.hexlify(nonce.to_bytes(8, 'little'))
-        pre_seal = nonce_bytes + block_bytes
-        seal_sh256 = hashlib.sha256( bytearray(hex_bytes_to_u8_list(pre_seal)) ).digest()
-        kec = keccak.new(digest_bits=256)
-        seal = kec.update( seal_sh256 ).digest()
+        # The seal hashes the raw little endian nonce followed by the raw block hash.
+        pre_seal = nonce.to_bytes(8, 'little') + bytes.fromhex( block_bytes.decode('utf-8') )
+        seal_sh256 = hashlib.sha256( pre_seal ).digest()
+        seal = keccak.new( digest_bits=256, data=seal_sh256 ).digest()
         return seal
 
     # Call cython function
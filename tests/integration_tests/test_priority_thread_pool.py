@@ -15,8 +15,9 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER 
 # DEALINGS IN THE SOFTWARE.
 
+import time
 import bittensor
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 priority_pool = bittensor.prioritythreadpool(max_workers=1)
 
@@ -32,5 +33,28 @@ def test_priority_thread_pool():
     assert save[1] == 9
 
 
+def test_priority_thread_pool_aging():
+    aging_pool = bittensor.prioritythreadpool(max_workers=1, aging_rate=100)
+    save = []
+    def save_number(number,save):
+        save += [number]
+    with aging_pool:
+        aging_pool._epoch -= 10
+        aging_pool.submit(time.sleep, 0.1, priority=1000)
+        aging_pool.submit(save_number, 'low', save, priority=1)
+        # A high priority task arriving 5 seconds later ranks behind the aged low priority task.
+        aging_pool._epoch -= 5
+        aging_pool.submit(save_number, 'high', save, priority=100)
+
+    assert save == ['low', 'high']
+
+def test_priority_thread_pool_aging_rate_from_enviroment():
+    defaults = bittensor.Config()
+    with patch.dict( 'os.environ', { 'BT_AXON_PRIORITY_AGING_RATE': '2.5' } ):
+        bittensor.prioritythreadpool.add_defaults( defaults )
+    assert defaults.axon.priority.aging_rate == 2.5
+    bittensor.prioritythreadpool.check_config( defaults )
+
+
 if __name__ == "__main__":
     test_priority_thread_pool()
\ No newline at end of file
@@ -995,6 +995,154 @@ def test_grpc_backward_fails():
 
     axon.stop()
 
+def test_auth_interceptor_nounce_dic_is_bounded():
+    interceptor = bittensor._axon.AuthInterceptor()
+    interceptor._nounce_cap = 2
+    for _ in range(3):
+        assert interceptor.vertification( sign( wallet ).split('bitxx') )
+    assert len( interceptor.nounce_dic ) == 2
+
+def test_auth_interceptor_keypair_is_cached():
+    interceptor = bittensor._axon.AuthInterceptor()
+    for _ in range(2):
+        assert interceptor.vertification( sign( wallet ).split('bitxx') )
+    assert list( interceptor._keypair_cache.keys() ) == [ wallet.hotkey.ss58_address ]
+
+def test_auth_interceptor_verifies_before_handler():
+    interceptor = bittensor._axon.AuthInterceptor( blacklist = None )
+    continuation = mock.MagicMock( return_value = grpc.unary_unary_rpc_method_handler( lambda request, context: 'response' ) )
+    good_signature = sign( wallet )
+    bad_signature = good_signature.replace( 'bitxx0x', 'bitxx0x00', 1 )
+    for signature, verified in [ ( good_signature, True ), ( bad_signature, False ) ]:
+        handler_call_details = mock.MagicMock( invocation_metadata = (
+            ('rpc-auth-header','Bittensor'),
+            ('bittensor-signature',signature),
+            ('bittensor-version',str(bittensor.__version_as_int__)),
+        ))
+        context = mock.MagicMock()
+        handler = interceptor.intercept_service( continuation, handler_call_details )
+        handler.unary_unary( None, context )
+        assert context.abort.called != verified
+
+def test_axon_skips_compression_for_small_responses():
+    response = bittensor.proto.TensorMessage( hotkey = wallet.hotkey.ss58_address )
+    for compression, threshold, skipped in [
+        ( grpc.Compression.Gzip, response.ByteSize() + 1, True ),
+        ( grpc.Compression.Gzip, response.ByteSize(), False ),
+        ( grpc.Compression.NoCompression, response.ByteSize() + 1, False ),
+    ]:
+        axon.compression = compression
+        axon.compression_threshold = threshold
+        context = mock.MagicMock()
+        axon._skip_compression_for_small_response( response, context )
+        assert context.set_compression.called == skipped
+    axon.compression = grpc.Compression.NoCompression
+    axon.compression_threshold = 0
+
+def test_load_shedding_interceptor_rejects_when_saturated():
+    interceptor = bittensor._axon.LoadSheddingInterceptor( limit = 1 )
+    continuation = mock.MagicMock( return_value = grpc.unary_unary_rpc_method_handler( lambda request, context: 'response' ) )
+    admitted = interceptor.intercept_service( continuation, mock.MagicMock() )
+    assert interceptor.inflight == 1
+
+    context = mock.MagicMock()
+    interceptor.intercept_service( continuation, mock.MagicMock() ).unary_unary( None, context )
+    context.abort.assert_called_once_with( grpc.StatusCode.UNAVAILABLE, 'overloaded' )
+
+    assert admitted.unary_unary( None, mock.MagicMock() ) == 'response'
+    assert interceptor.inflight == 0
+
+    # Calls that never reach their handler release their slot once dropped.
+    interceptor.intercept_service( continuation, mock.MagicMock() )
+    assert interceptor.inflight == 0
+
+def test_load_shedding_interceptor_holds_streaming_calls_until_exhausted():
+    interceptor = bittensor._axon.LoadSheddingInterceptor( limit = 1 )
+    continuation = mock.MagicMock( return_value = grpc.unary_stream_rpc_method_handler( lambda request, context: iter([ 1, 2 ]) ) )
+    responses = interceptor.intercept_service( continuation, mock.MagicMock() ).unary_stream( None, mock.MagicMock() )
+    assert next( responses ) == 1
+    assert interceptor.inflight == 1
+    assert list( responses ) == [ 2 ]
+    assert interceptor.inflight == 0
+
+def test_axon_max_inflight_must_be_positive():
+    config = bittensor.axon.config()
+    with pytest.raises( AssertionError ):
+        bittensor.axon( wallet = wallet, config = config, max_inflight = 0 )
+
+def test_load_shedding_slot_release_does_not_take_the_lock():
+    # A finalizer may release a slot on a thread which already holds the interceptor's lock.
+    interceptor = bittensor._axon.LoadSheddingInterceptor( limit = 1 )
+    slot = bittensor._axon._InflightSlot( interceptor )
+    interceptor._admitted += 1
+    with interceptor._lock:
+        slot.release()
+    assert interceptor.inflight == 0
+
+def test_axon_add_defaults_casts_enviroment_variables():
+    defaults = bittensor.Config()
+    with mock.patch.dict( 'os.environ', { 'BT_AXON_PORT': '8092', 'BT_AXON_MAX_WORKERS': '3' } ):
+        bittensor.axon.add_defaults( defaults )
+    assert defaults.axon.port == 8092
+    assert defaults.axon.max_workers == 3
+
+def test_auth_interceptor_deny_messages_are_per_request():
+    interceptor = bittensor._axon.AuthInterceptor( blacklist = lambda pubkey, request_type: True )
+    bad_header = mock.MagicMock( invocation_metadata = ( ('rpc-auth-header','Other'), ) )
+    black_listed = mock.MagicMock( invocation_metadata = (
+        ('rpc-auth-header','Bittensor'),
+        ('bittensor-signature',sign( wallet )),
+        ('request_type','1'),
+    ))
+    continuation = mock.MagicMock( return_value = grpc.unary_unary_rpc_method_handler( lambda request, context: 'response' ) )
+    first = interceptor.intercept_service( continuation, bad_header )
+    second = interceptor.intercept_service( continuation, black_listed )
+    for handler, message in [ ( first, 'Incorrect Metadata format' ), ( second, 'Black listed' ) ]:
+        context = mock.MagicMock()
+        handler.unary_unary( None, context )
+        context.abort.assert_called_once_with( grpc.StatusCode.UNAUTHENTICATED, message )
+
+def test_auth_interceptor_checks_signature_before_blacklist():
+    blacklist = mock.MagicMock( return_value = False )
+    interceptor = bittensor._axon.AuthInterceptor( blacklist = blacklist )
+    nounce, pubkey, _, receptor_uid = sign( wallet ).split( 'bitxx' )
+    forged = mock.MagicMock( invocation_metadata = (
+        ('rpc-auth-header','Bittensor'),
+        ('bittensor-signature','bitxx'.join([ nounce, pubkey, '0x' + '00' * 64, receptor_uid ])),
+        ('request_type','1'),
+    ))
+    continuation = mock.MagicMock( return_value = grpc.unary_unary_rpc_method_handler( lambda request, context: 'response' ) )
+    context = mock.MagicMock()
+    interceptor.intercept_service( continuation, forged ).unary_unary( None, context )
+    context.abort.assert_called_once()
+    assert context.abort.call_args[0][0] == grpc.StatusCode.UNAUTHENTICATED
+    blacklist.assert_not_called()
+
+def test_auth_interceptor_verification_timeout_is_unavailable():
+    interceptor = bittensor._axon.AuthInterceptor( verify_timeout = 0 )
+    verification = mock.MagicMock()
+    verification.result.side_effect = concurrent.futures.TimeoutError()
+    handler = interceptor._verified_handler( grpc.unary_unary_rpc_method_handler( lambda request, context: 'response' ), verification )
+    context = mock.MagicMock()
+    handler.unary_unary( None, context )
+    context.abort.assert_called_once_with( grpc.StatusCode.UNAVAILABLE, 'Signature verification timed out' )
+
+def test_axon_does_not_mutate_config():
+    config = bittensor.axon.config()
+    port = config.axon.port
+    bittensor.axon( wallet = wallet, config = config, port = get_random_unused_port() )
+    assert config.axon.port == port
+
+def test_auth_interceptor_denies_streaming_calls_with_stream_handlers():
+    interceptor = bittensor._axon.AuthInterceptor()
+    continuation = mock.MagicMock( return_value = grpc.stream_stream_rpc_method_handler( lambda request_iterator, context: iter([]) ) )
+    handler_call_details = mock.MagicMock( invocation_metadata = ( ('rpc-auth-header','Other'), ) )
+    handler = interceptor.intercept_service( continuation, handler_call_details )
+    assert handler.request_streaming and handler.response_streaming
+    context = mock.MagicMock()
+    handler.stream_stream( iter([]), context )
+    context.abort.assert_called_once_with( grpc.StatusCode.UNAUTHENTICATED, 'Incorrect Metadata format' )
+
 def is_port_in_use(port):
     import socket
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
@@ -1008,7 +1156,7 @@ def test_axon_is_destroyed():
     port = get_random_unused_port()
     assert is_port_in_use( port ) == False
     axon = bittensor.axon ( port = port )
-    assert is_port_in_use( port ) == True
+    assert is_port_in_use( port ) == False
     axon.start()
     assert is_port_in_use( port ) == True
     axon.stop()
@@ -1019,7 +1167,7 @@ def test_axon_is_destroyed():
     port = get_random_unused_port()
     assert is_port_in_use( port ) == False
     axon2 = bittensor.axon ( port = port )
-    assert is_port_in_use( port ) == True
+    assert is_port_in_use( port ) == False
     axon2.start()
     assert is_port_in_use( port ) == True
     axon2.__del__()
@@ -1028,10 +1176,10 @@ def test_axon_is_destroyed():
     port_3 = get_random_unused_port()
     assert is_port_in_use( port_3 ) == False
     axonA = bittensor.axon ( port = port_3 )
-    assert is_port_in_use( port_3 ) == True
+    assert is_port_in_use( port_3 ) == False
     axonB = bittensor.axon ( port = port_3 )
     assert axonA.server != axonB.server
-    assert is_port_in_use( port_3 ) == True
+    assert is_port_in_use( port_3 ) == False
     axonA.start()
     assert is_port_in_use( port_3 ) == True
     axonB.start()
@@ -7,6 +7,7 @@ import subprocess
 import time
 import pytest
 import os 
+import math
 import random
 import torch
 import multiprocessing
@@ -97,6 +98,16 @@ def test_unbiased_topk():
     assert torch.all(torch.eq(topk[0], torch.Tensor([10., 9.])))
     assert torch.all(torch.eq(topk[1], torch.Tensor([9, 8])))
 
+def test_unbiased_topk_breaks_ties_randomly():
+    input_tensor = torch.FloatTensor([1., 3., 3., 3., 5., 0.])
+    chosen = set()
+    for _ in range(100):
+        topk, indices = bittensor.utils.unbiased_topk(input_tensor, 2)
+        assert torch.all(torch.eq(topk, torch.Tensor([5., 3.])))
+        assert indices[0] == 4
+        chosen.add(int(indices[1]))
+    assert chosen == {1, 2, 3}
+
 def test_hex_bytes_to_u8_list():
     nonce = 1
     nonce_bytes = binascii.hexlify(nonce.to_bytes(8, 'little'))
@@ -187,6 +198,77 @@ def test_solve_for_difficulty_fast_registered_already():
         # called every time until True
         assert wallet.is_registered.call_count == workblocks_before_is_registered + 1
 
+def test_solve_for_difficulty_fast_cuda_picks_up_new_block():
+    block_hashes = { 1: '0x' + '11' * 32, 2: '0x' + '22' * 32 }
+    subtensor = MagicMock()
+    subtensor.get_current_block = MagicMock( return_value=1 )
+    subtensor.difficulty = 1
+    subtensor.substrate = MagicMock()
+    subtensor.substrate.get_block_hash = MagicMock( side_effect=lambda block_number: block_hashes[block_number] )
+    wallet = MagicMock()
+    wallet.is_registered = MagicMock( return_value=False )
+
+    launches = []
+    def solve_cuda( nonce, update_interval, TPB, block_bytes, block_number, *args ):
+        launches.append( (block_bytes, block_number) )
+        if len( launches ) == 1:
+            # A new block lands while the first kernel runs.
+            subtensor.get_current_block.return_value = 2
+            return -1, b''
+        return 10, b'seal'
+
+    with patch( 'torch.cuda.is_available', return_value=True ), \
+        patch( 'bittensor.utils.solve_cuda', side_effect=solve_cuda ), \
+        patch( 'bittensor.utils.reset_cuda' ) as reset_cuda:
+        solution = bittensor.utils.solve_for_difficulty_fast_cuda( subtensor, wallet, update_interval=1, TPB=1 )
+
+    assert launches == [ (b'11' * 32, 1), (b'22' * 32, 2) ]
+    assert solution.nonce == 10
+    assert solution.block_number == 2
+    assert reset_cuda.call_count == 1
+
+def test_solve_for_difficulty_fast_cuda_registered_already():
+    block_hash = '0xba7ea4eb0b16dee271dbef5911838c3f359fcf598c74da65a54b919b68b67279'
+    subtensor = MagicMock()
+    subtensor.get_current_block = MagicMock( return_value=1 )
+    subtensor.difficulty = 1
+    subtensor.substrate = MagicMock()
+    subtensor.substrate.get_block_hash = MagicMock( return_value=block_hash )
+    wallet = MagicMock()
+    # registered while the first kernel runs
+    wallet.is_registered = MagicMock( side_effect=[False, True] )
+
+    with patch( 'torch.cuda.is_available', return_value=True ), \
+        patch( 'bittensor.utils.solve_cuda', return_value=(-1, b'') ) as solve_cuda, \
+        patch( 'bittensor.utils.reset_cuda' ) as reset_cuda:
+        solution = bittensor.utils.solve_for_difficulty_fast_cuda( subtensor, wallet, update_interval=1, TPB=1 )
+
+    assert solution is None
+    assert solve_cuda.call_count == 1
+    assert wallet.is_registered.call_count == 2
+    assert reset_cuda.call_count == 1
+
+def test_solve_for_nonce_block_sends_best_only_on_improvement():
+    block_bytes = b'ba7ea4eb0b16dee271dbef5911838c3f359fcf598c74da65a54b919b68b67279'
+    limit = int(math.pow(2,256)) - 1
+    solver = MagicMock()
+    solver.best_sent = float('inf')
+    for _ in range(2):
+        solution, _ = bittensor.utils.solve_for_nonce_block( solver, 0, 100, block_bytes, limit, limit, 1 )
+        assert solution is None
+    assert solver.best_queue.put.call_count == 1
+
+def test_indexed_values_to_dataframe():
+    values = torch.tensor([ 0.5, 0.0, 2.0 ])
+    dataframe = bittensor.utils.indexed_values_to_dataframe( prefix = 1, index = torch.LongTensor([ 2, 0, 1, 5, -1 ]), values = values )
+    assert list( dataframe.columns ) == [ '1' ]
+    assert list( dataframe.index ) == [ 2, 0, 1 ]
+    assert list( dataframe['1'] ) == [ 2.0, 0.5, 0.0 ]
+
+    dataframe = bittensor.utils.indexed_values_to_dataframe( prefix = 'w', index = [ 0, 1, 2 ], values = values.tolist(), filter_zeros = True )
+    assert list( dataframe.index ) == [ 0, 1, 2 ]
+    assert dataframe['w'].isna().tolist() == [ False, True, False ]
+
 def test_solve_for_difficulty_fast_missing_hash():
     block_hash = '0xba7ea4eb0b16dee271dbef5911838c3f359fcf598c74da65a54b919b68b67279'
     subtensor = MagicMock()